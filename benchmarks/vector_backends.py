@@ -0,0 +1,149 @@
+"""
+Compare insert/search latency and memory of the local and Qdrant vector backends.
+
+Uses random unit vectors so no embedding API calls are made. Each backend runs
+in its own subprocess so memory figures do not leak between runs. Run from the
+project root:
+
+    uv run python -m benchmarks.vector_backends --points 5000
+    uv run python -m benchmarks.vector_backends --qdrant-url http://localhost:4580
+"""
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+from src.questionanswer.backends import LocalBackend, QdrantBackend, VectorBackend
+
+
+def proc_status_mb(field: str) -> float:
+    """Read a memory field (e.g. VmRSS, VmHWM) of this process from /proc, in MB"""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def qdrant_resident_mb(url: str) -> float:
+    """Resident memory reported by the Qdrant server's /metrics endpoint, in MB"""
+    try:
+        with urllib.request.urlopen(f"{url.rstrip('/')}/metrics", timeout=5) as r:
+            metrics = r.read().decode()
+    except OSError:
+        return float("nan")
+    for line in metrics.splitlines():
+        if line.startswith("memory_resident_bytes"):
+            return float(line.split()[-1]) / 2**20
+    return float("nan")
+
+
+def directory_mb(path: str) -> float:
+    return sum(p.stat().st_size for p in Path(path).rglob("*") if p.is_file()) / 2**20
+
+
+def measure(backend: VectorBackend, args) -> dict:
+    """Insert ``args.points`` random vectors, then time ``args.queries`` searches"""
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((args.points, args.dim), dtype=np.float32)
+    queries = rng.standard_normal((args.queries, args.dim), dtype=np.float32).tolist()
+    ids = [str(uuid.uuid4()) for _ in range(args.points)]
+    payloads = [{"header": None, "page_content": f"chunk {i}"} for i in range(args.points)]
+
+    rss_before = proc_status_mb("VmRSS")
+    insert_s = 0.0
+    for i in range(0, args.points, args.batch_size):
+        # Embeddings arrive as Python lists; convert outside the timed region.
+        batch = vectors[i : i + args.batch_size].tolist()
+        start = time.perf_counter()
+        backend.upsert_points(
+            ids[i : i + args.batch_size], batch, payloads[i : i + args.batch_size]
+        )
+        insert_s += time.perf_counter() - start
+    del batch
+
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        backend.search_points(query, limit=args.limit)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return {
+        "insert_s": insert_s,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "client_rss_mb": proc_status_mb("VmRSS") - rss_before,
+    }
+
+
+def run_worker(args):
+    """Benchmark one backend in this process and print a single result line"""
+    if args.worker == "qdrant":
+        collection_name = f"bench_{uuid.uuid4().hex[:8]}"
+        backend = QdrantBackend(args.qdrant_url, collection_name, args.dim)
+        server_before = qdrant_resident_mb(args.qdrant_url)
+        try:
+            result = measure(backend, args)
+            server_after = qdrant_resident_mb(args.qdrant_url)
+        finally:
+            backend.client.delete_collection(collection_name)
+        storage = f"server rss +{server_after - server_before:7.1f}MB"
+    else:
+        path = tempfile.mkdtemp(prefix="vector_bench_")
+        try:
+            backend = LocalBackend(path, "bench", args.dim, dtype=args.worker.split("/")[1])
+            result = measure(backend, args)
+            storage = f"on disk {directory_mb(path):10.1f}MB"
+        finally:
+            shutil.rmtree(path)
+    print(
+        f"{args.worker:<16} insert {result['insert_s']:6.2f}s  "
+        f"search p50 {result['p50_ms']:7.2f}ms  p95 {result['p95_ms']:7.2f}ms  "
+        f"client rss +{result['client_rss_mb']:7.1f}MB  {storage}",
+        flush=True,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=3072)
+    parser.add_argument("--limit", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument(
+        "--qdrant-url", default=None, help="Also benchmark a running Qdrant server"
+    )
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args)
+        return
+
+    print(f"{args.points} points, {args.queries} queries, dim {args.dim}, top-{args.limit}")
+    print(
+        "client rss: growth of the benchmark process's resident memory, "
+        "including mapped vector pages; server rss: Qdrant memory_resident_bytes"
+    )
+    workers = [f"local/{dtype}" for dtype in LocalBackend.SUPPORTED_DTYPES]
+    if args.qdrant_url:
+        workers.append("qdrant")
+    for worker in workers:
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.vector_backends", *sys.argv[1:], "--worker", worker],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,10 @@ class Settings(BaseSettings):
     GROQ_API_KEY: str
     GOOGLE_API_KEY: str
     GOOGLE_EMBEDDINGS_MODEL: str
-    QDRANT_URL: str
+    VECTOR_BACKEND: str = "qdrant"
+    QDRANT_URL: str = "http://localhost:4580"
+    LOCAL_VECTOR_PATH: str = "vector_store"
+    LOCAL_VECTOR_DTYPE: str = "float32"
 
 
 settings = Settings()
@@ -0,0 +1,313 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from qdrant_client import QdrantClient, models
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+
+@dataclass
+class SearchHit:
+    """A scored search result, shaped like a Qdrant ``ScoredPoint``."""
+
+    id: str
+    score: float
+    payload: dict
+
+
+class VectorBackend(ABC):
+    """Storage and exact/approximate search over pre-computed vectors."""
+
+    @abstractmethod
+    def upsert_points(self, ids: list[str], vectors: list, payloads: list[dict]):
+        """
+        Store vectors together with their payloads.
+
+        Args:
+            ids (list[str]): Point identifiers.
+            vectors (list): One embedding per point.
+            payloads (list[dict]): One payload per point.
+        """
+
+    @abstractmethod
+    def search_points(self, vector: list, limit: int) -> list:
+        """
+        Return the ``limit`` points closest to ``vector`` by cosine similarity.
+
+        Args:
+            vector (list): The query embedding.
+            limit (int): Maximum number of hits.
+
+        Returns:
+            list: Hits exposing ``id``, ``score`` and ``payload``.
+        """
+
+
+class QdrantBackend(VectorBackend):
+    """Vector backend backed by a Qdrant server."""
+
+    def __init__(self, url: str, collection_name: str, vector_size: int):
+        self.client = QdrantClient(url=url)
+        self.collection_name = collection_name
+        self.vector_size = vector_size
+        self.__create_collection()
+
+    def __create_collection(self):
+        """Create a collection in Qdrant if it does not exist"""
+        try:
+            self.client.get_collection(self.collection_name)
+
+        except Exception:
+            self.client.create_collection(
+                collection_name=self.collection_name,
+                vectors_config=models.VectorParams(
+                    size=self.vector_size,
+                    distance=models.Distance.COSINE,
+                ),
+            )
+
+    def upsert_points(self, ids: list[str], vectors: list, payloads: list[dict]):
+        points = [
+            models.PointStruct(id=point_id, vector=vector, payload=payload)
+            for point_id, vector, payload in zip(ids, vectors, payloads)
+        ]
+        self.client.upsert(
+            collection_name=self.collection_name,
+            points=points,
+        )
+
+    def search_points(self, vector: list, limit: int) -> list:
+        result = self.client.query_points(
+            collection_name=self.collection_name,
+            query=vector,
+            query_filter=None,
+            limit=limit,
+        )
+        return result.points
+
+
+class LocalBackend(VectorBackend):
+    """
+    Embedded vector backend for single-node and offline deployments.
+
+    Vectors are L2-normalised and stored as fixed-size rows of a raw
+    ``vectors.bin`` file that is memory-mapped for search, so cosine similarity
+    reduces to a dot product. ``payloads.jsonl`` is an append-only log of
+    ``{"id", "row", "payload"}`` records in which the last record for a row
+    wins, so upserting an existing id overwrites its row in place. Search is an
+    exact, vectorised top-k scan, which is fast enough for tens of thousands of
+    chunks.
+
+    Writers serialise on ``store.lock``. Every instance picks up points written
+    by other instances or processes as soon as the payload log grows.
+    """
+
+    SUPPORTED_DTYPES = ("float32", "float16")
+    # Rows upcast to float32 per step when scoring a float16 store.
+    SEARCH_BLOCK_ROWS = 256
+
+    def __init__(
+        self,
+        path: str,
+        collection_name: str,
+        vector_size: int,
+        dtype: str = "float32",
+    ):
+        if dtype not in self.SUPPORTED_DTYPES:
+            raise ValueError(
+                f"Unsupported dtype {dtype!r}, expected one of {self.SUPPORTED_DTYPES}"
+            )
+        self.collection_name = collection_name
+        self.vector_size = vector_size
+        self.dtype = np.dtype(dtype)
+        self.directory = Path(path) / collection_name
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.vectors_path = self.directory / "vectors.bin"
+        self.payloads_path = self.directory / "payloads.jsonl"
+        self.lock_path = self.directory / "store.lock"
+        self.ids, self.payloads, self.rows = [], [], {}
+        # Bytes of payloads.jsonl already applied to ids/payloads/rows.
+        self.log_offset = 0
+        with self.__locked():
+            self.__check_meta()
+            self.__recover(torn=self.__read_log())
+        self.__map_vectors()
+
+    @property
+    def row_bytes(self) -> int:
+        return self.vector_size * self.dtype.itemsize
+
+    @contextmanager
+    def __locked(self):
+        """Hold the store's write lock; released when the lock file closes"""
+        with open(self.lock_path, "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+    def __check_meta(self):
+        """Record the store layout on creation and reject mismatches on reopen"""
+        meta_path = self.directory / "meta.json"
+        meta = {"vector_size": self.vector_size, "dtype": self.dtype.name}
+        if not meta_path.exists():
+            meta_path.write_text(json.dumps(meta))
+            return
+        stored = json.loads(meta_path.read_text())
+        if stored != meta:
+            raise ValueError(
+                f"Local store at {self.directory} was created with {stored}, "
+                f"but {meta} was requested"
+            )
+
+    def __read_log(self) -> bool:
+        """
+        Apply payload records appended since the last read.
+
+        Returns:
+            bool: True if the log ends in an incomplete or unreadable record.
+        """
+        if not self.payloads_path.exists():
+            return False
+        with open(self.payloads_path, "rb") as f:
+            f.seek(self.log_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return True
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    return True
+                row = record["row"]
+                if row > len(self.ids):
+                    return True
+                if row == len(self.ids):
+                    self.ids.append(record["id"])
+                    self.payloads.append(record["payload"])
+                else:
+                    self.payloads[row] = record["payload"]
+                self.rows[record["id"]] = row
+                self.log_offset += len(line)
+        return False
+
+    def __recover(self, torn: bool):
+        """Drop a torn log tail and vectors without a payload (interrupted upsert)"""
+        if torn:
+            os.truncate(self.payloads_path, self.log_offset)
+        self.payloads_path.touch()
+        self.vectors_path.touch()
+        size = self.vectors_path.stat().st_size
+        count = min(size // self.row_bytes, len(self.ids))
+        if count * self.row_bytes != size:
+            os.truncate(self.vectors_path, count * self.row_bytes)
+        if count != len(self.ids):
+            # Only reachable if vectors.bin itself was cut short; compact the log.
+            for point_id in self.ids[count:]:
+                del self.rows[point_id]
+            del self.ids[count:]
+            del self.payloads[count:]
+            lines = self.__serialize(zip(self.ids, range(count), self.payloads))
+            self.payloads_path.write_bytes(lines)
+            self.log_offset = len(lines)
+
+    def __serialize(self, records) -> bytes:
+        return "".join(
+            json.dumps({"id": point_id, "row": row, "payload": payload}) + "\n"
+            for point_id, row, payload in records
+        ).encode("utf-8")
+
+    def __map_vectors(self):
+        """(Re)map the vector file; an empty file cannot be memory-mapped"""
+        count = len(self.ids)
+        self.matrix = (
+            np.memmap(
+                self.vectors_path,
+                dtype=self.dtype,
+                mode="r",
+                shape=(count, self.vector_size),
+            )
+            if count
+            else None
+        )
+
+    def __refresh(self):
+        """Pick up points written by other instances since the last read"""
+        if self.payloads_path.stat().st_size == self.log_offset:
+            return
+        count = len(self.ids)
+        self.__read_log()
+        # Rows overwritten in place are already visible through the shared map.
+        if len(self.ids) != count:
+            self.__map_vectors()
+
+    def __normalize(self, vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def upsert_points(self, ids: list[str], vectors: list, payloads: list[dict]):
+        if not ids:
+            return
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.shape != (len(ids), self.vector_size):
+            raise ValueError(
+                f"Expected vectors of shape ({len(ids)}, {self.vector_size}), "
+                f"got {matrix.shape}"
+            )
+        matrix = self.__normalize(matrix).astype(self.dtype)
+        # As in Qdrant, the last occurrence of an id within a batch wins.
+        latest = {point_id: i for i, point_id in enumerate(ids)}
+        with self.__locked():
+            self.__refresh()
+            rows, next_row = {}, len(self.ids)
+            for point_id in latest:
+                rows[point_id] = self.rows.get(point_id)
+                if rows[point_id] is None:
+                    rows[point_id] = next_row
+                    next_row += 1
+            # Serialise before touching any file so a bad payload changes nothing.
+            lines = self.__serialize(
+                (point_id, row, payloads[latest[point_id]])
+                for point_id, row in rows.items()
+            )
+            # Vectors first: recovery trims rows whose payload record is missing.
+            with open(self.vectors_path, "r+b") as f:
+                for point_id, row in rows.items():
+                    f.seek(row * self.row_bytes)
+                    f.write(matrix[latest[point_id]].tobytes())
+            with open(self.payloads_path, "ab") as f:
+                f.write(lines)
+            self.__read_log()
+        self.__map_vectors()
+
+    def search_points(self, vector: list, limit: int) -> list[SearchHit]:
+        self.__refresh()
+        if self.matrix is None or limit <= 0:
+            return []
+        query = self.__normalize(np.asarray(vector, dtype=np.float32))
+        count = self.matrix.shape[0]
+        if self.dtype == np.float32:
+            scores = self.matrix @ query
+        else:
+            # No BLAS kernel for float16; upcast cache-sized blocks instead.
+            scores = np.empty(count, dtype=np.float32)
+            for start in range(0, count, self.SEARCH_BLOCK_ROWS):
+                block = self.matrix[start : start + self.SEARCH_BLOCK_ROWS]
+                np.dot(
+                    block.astype(np.float32),
+                    query,
+                    out=scores[start : start + len(block)],
+                )
+        k = min(limit, count)
+        top = np.argpartition(scores, count - k)[count - k :]
+        top = top[np.argsort(scores[top])[::-1]]
+        return [
+            SearchHit(id=self.ids[i], score=float(scores[i]), payload=self.payloads[i])
+            for i in top
+        ]
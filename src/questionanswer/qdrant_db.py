@@ -1,49 +1,61 @@
-from qdrant_client import QdrantClient, models
+from src.questionanswer.backends import LocalBackend, QdrantBackend, VectorBackend
 import uuid
+from functools import lru_cache
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from src.config import settings
 
-client = QdrantClient(settings.QDRANT_URL)
+
+@lru_cache
+def get_vector_backend(collection_name: str, vector_size: int) -> VectorBackend:
+    """
+    Build the vector backend selected by ``settings.VECTOR_BACKEND``.
+
+    Cached so every ``QdrantConfig`` in the process shares one backend.
+
+    Args:
+        collection_name (str): Name of the collection to store points in.
+        vector_size (int): Dimensionality of the embeddings.
+
+    Returns:
+        VectorBackend: ``QdrantBackend`` for "qdrant", ``LocalBackend`` for "local".
+    """
+    if settings.VECTOR_BACKEND == "qdrant":
+        return QdrantBackend(settings.QDRANT_URL, collection_name, vector_size)
+    if settings.VECTOR_BACKEND == "local":
+        return LocalBackend(
+            settings.LOCAL_VECTOR_PATH,
+            collection_name,
+            vector_size,
+            dtype=settings.LOCAL_VECTOR_DTYPE,
+        )
+    raise ValueError(
+        f"Unknown VECTOR_BACKEND {settings.VECTOR_BACKEND!r}, expected 'qdrant' or 'local'"
+    )
 
 
 class QdrantConfig:
-    """Configuration for Qdrant client."""
+    """Configuration for the vector store used for retrieval."""
 
     def __init__(self):
-        self.client = QdrantClient(url=settings.QDRANT_URL)
         self.collection_name = "apple_collection"
+        self.backend = get_vector_backend(self.collection_name, vector_size=3072)
         self.embedding_model = GoogleGenerativeAIEmbeddings(
             model=settings.GOOGLE_EMBEDDINGS_MODEL,
             google_api_key=settings.GOOGLE_API_KEY,
         )
-        self.__create_collection()
-
-    def __create_collection(self):
-        """Create a collection in Qdrant if it does not exist"""
-        try:
-            self.client.get_collection(self.collection_name)
-
-        except Exception:
-            self.client.create_collection(
-                collection_name=self.collection_name,
-                vectors_config=models.VectorParams(
-                    size=3072,
-                    distance=models.Distance.COSINE,
-                ),
-            )
 
     def upsert_documents(self, summary_texts: list[str], md_header_splits: list):
         """
-        Upsert documents into the Qdrant collection.
+        Upsert documents into the configured vector backend.
 
         Args:
             summary_texts (list[str]): List of documents to upsert.
             md_header_splits (list): List of metadata objects for each document.
         """
-        points = []
+        ids, vectors, payloads = [], [], []
         for i, text in enumerate(summary_texts):
-            point_id = str(uuid.uuid4())
-            vector = self.embedding_model.embed_query(text)
+            ids.append(str(uuid.uuid4()))
+            vectors.append(self.embedding_model.embed_query(text))
             # Loop through md_header_splits for each document
             header = (
                 md_header_splits[i].metadata
@@ -55,29 +67,18 @@ class QdrantConfig:
                 if hasattr(md_header_splits[i], "page_content")
                 else None
             )
-            points.append(
-                models.PointStruct(
-                    id=point_id,
-                    vector=vector,
-                    payload={
-                        "header": header,
-                        "page_content": page_content,
-                    },
-                )
+            payloads.append(
+                {
+                    "header": header,
+                    "page_content": page_content,
+                }
             )
-        self.client.upsert(
-            collection_name=self.collection_name,
-            points=points,
-        )
+        self.backend.upsert_points(ids, vectors, payloads)
         return True
 
     def search_documents(self, query):
         """Search the  documents"""
-        result = self.client.query_points(
-            collection_name=self.collection_name,
-            query=self.embedding_model.embed_query(query),
-            query_filter=None,
-            limit=3,
+        hits = self.backend.search_points(
+            self.embedding_model.embed_query(query), limit=3
         )
-        hits = result.points
         return hits
@@ -0,0 +1,126 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.questionanswer.backends import LocalBackend
+
+DIM = 4
+
+
+def unit(axis: int) -> list[float]:
+    vector = [0.0] * DIM
+    vector[axis] = 1.0
+    return vector
+
+
+@pytest.fixture
+def store(tmp_path):
+    backend = LocalBackend(str(tmp_path), "test", DIM)
+    backend.upsert_points(
+        ["a", "b", "c"],
+        [unit(0), unit(1), [1.0, 1.0, 0.0, 0.0]],
+        [{"text": "a"}, {"text": "b"}, {"text": "c"}],
+    )
+    return backend
+
+
+def hit_ids(hits) -> list[str]:
+    return [hit.id for hit in hits]
+
+
+def test_empty_store_returns_no_hits(tmp_path):
+    assert LocalBackend(str(tmp_path), "test", DIM).search_points(unit(0), 3) == []
+
+
+def test_search_ranks_by_cosine_similarity(store):
+    hits = store.search_points(unit(0), 2)
+    assert hit_ids(hits) == ["a", "c"]
+    assert hits[0].score == pytest.approx(1.0)
+    assert hits[1].score == pytest.approx(2**-0.5)
+    assert hits[0].payload == {"text": "a"}
+
+
+@pytest.mark.parametrize("dtype", LocalBackend.SUPPORTED_DTYPES)
+def test_reopen_restores_points(tmp_path, dtype):
+    LocalBackend(str(tmp_path), "test", DIM, dtype=dtype).upsert_points(
+        ["a", "b"], [unit(0), unit(1)], [{"text": "a"}, {"text": "b"}]
+    )
+    reopened = LocalBackend(str(tmp_path), "test", DIM, dtype=dtype)
+    hits = reopened.search_points(unit(1), 1)
+    assert hit_ids(hits) == ["b"]
+    assert hits[0].payload == {"text": "b"}
+
+
+def test_upsert_overwrites_existing_id(store, tmp_path):
+    store.upsert_points(["a"], [unit(2)], [{"text": "a2"}])
+    assert len(store.ids) == 3
+    assert store.vectors_path.stat().st_size == 3 * store.row_bytes
+    hits = store.search_points(unit(2), 1)
+    assert hit_ids(hits) == ["a"]
+    assert hits[0].payload == {"text": "a2"}
+
+    reopened = LocalBackend(str(tmp_path), "test", DIM)
+    assert reopened.ids == ["a", "b", "c"]
+    assert reopened.search_points(unit(2), 1)[0].payload == {"text": "a2"}
+
+
+def test_repeated_id_in_batch_keeps_last(tmp_path):
+    backend = LocalBackend(str(tmp_path), "test", DIM)
+    backend.upsert_points(
+        ["a", "a"], [unit(0), unit(1)], [{"text": "first"}, {"text": "last"}]
+    )
+    hits = backend.search_points(unit(1), 3)
+    assert hit_ids(hits) == ["a"]
+    assert hits[0].payload == {"text": "last"}
+
+
+def test_recovers_from_torn_write(store, tmp_path):
+    # An upsert interrupted after its vectors but mid-way through its payloads.
+    with open(store.vectors_path, "ab") as f:
+        f.write(np.ones((2, DIM), dtype=np.float32).tobytes())
+    with open(store.payloads_path, "a") as f:
+        f.write(json.dumps({"id": "d", "row": 3, "payload": {}}) + "\n")
+        f.write('{"id": "e", "ro')
+
+    reopened = LocalBackend(str(tmp_path), "test", DIM)
+    assert reopened.ids == ["a", "b", "c", "d"]
+    assert reopened.vectors_path.stat().st_size == 4 * reopened.row_bytes
+    reopened.upsert_points(["f"], [unit(3)], [{"text": "f"}])
+    assert hit_ids(reopened.search_points(unit(3), 1)) == ["f"]
+    assert LocalBackend(str(tmp_path), "test", DIM).ids == ["a", "b", "c", "d", "f"]
+
+
+def test_rejects_layout_mismatch(store, tmp_path):
+    with pytest.raises(ValueError):
+        LocalBackend(str(tmp_path), "test", DIM, dtype="float16")
+    with pytest.raises(ValueError):
+        LocalBackend(str(tmp_path), "test", DIM + 1)
+
+
+def test_failed_upsert_leaves_store_unchanged(store, tmp_path):
+    vectors_size = store.vectors_path.stat().st_size
+    payloads_size = store.payloads_path.stat().st_size
+    with pytest.raises(TypeError):
+        store.upsert_points(
+            ["p", "q"], [unit(2), unit(3)], [{"text": "p"}, {"bad": object()}]
+        )
+    assert store.vectors_path.stat().st_size == vectors_size
+    assert store.payloads_path.stat().st_size == payloads_size
+
+    store.upsert_points(["q"], [unit(3)], [{"text": "q"}])
+    for backend in (store, LocalBackend(str(tmp_path), "test", DIM)):
+        hits = backend.search_points(unit(3), 1)
+        assert hit_ids(hits) == ["q"]
+        assert hits[0].score == pytest.approx(1.0)
+
+
+def test_instances_see_each_others_writes(tmp_path):
+    writer = LocalBackend(str(tmp_path), "test", DIM)
+    reader = LocalBackend(str(tmp_path), "test", DIM)
+    writer.upsert_points(["a", "b"], [unit(0), unit(1)], [{}, {}])
+    assert hit_ids(reader.search_points(unit(1), 1)) == ["b"]
+
+    reader.upsert_points(["c"], [unit(2)], [{}])
+    assert writer.ids == ["a", "b"]
+    assert hit_ids(writer.search_points(unit(2), 1)) == ["c"]